@@ -7,7 +7,7 @@ from pathlib import Path
 
 from t.troom import a_map, o
 from space.master import MasterControlProgram as MCP
-from space.map import import_map_from_path
+from space.map.cache import MapCache
 
 profile = False
 
@@ -21,7 +21,7 @@ if "--profile" in c:
 for arg in c:
     if (candidate := Path(arg)).suffix == ".map" and candidate.is_file():
         c.remove(arg)
-        a_map = import_map_from_path(candidate)
+        a_map = MapCache().load(candidate)
         for dood in o:
             a_map.randomly_drop(dood)
         break
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Compare the dense (Map) and chunked (ChunkedMap) storage layouts.
+
+Builds the same sparse world both ways -- copies of a station map scattered
+over a large area, half of them placed at negative coordinates so the map has
+to translate -- then reports build time, memory held by the storage, random
+get() lookups and a full iter_type() walk.
+
+Usage:
+  python scripts/bench-chunked.py [--spread N] [--copies N] [--seed N] [map]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map import Map, ChunkedMap, Cell, import_map_from_path
+
+
+def build(cls, station, offsets):
+    a_map = cls()
+    for x, y in offsets:
+        a_map[x, y] = station
+    return a_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spread", type=int, default=800, help="the world is about this many cells across")
+    parser.add_argument("--copies", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("map", nargs="?", default="asset/station1.map")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    station = import_map_from_path(args.map)
+    half = args.spread // 2
+    offsets = [(rng.randint(-half, half), rng.randint(-half, half)) for _ in range(args.copies)]
+    print(f"{args.copies} copies of {args.map} ({station.bounds}) over ~{args.spread}×{args.spread}")
+
+    for cls in (Map, ChunkedMap):
+        gc.collect()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        a_map = build(cls, station, offsets)
+        t_build = time.perf_counter() - t0
+        gc.collect()
+        mem, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        b = a_map.bounds
+        probes = [(rng.randint(0, b.X), rng.randint(0, b.Y)) for _ in range(100_000)]
+        t0 = time.perf_counter()
+        for p in probes:
+            a_map.get(*p)
+        t_get = (time.perf_counter() - t0) / len(probes)
+
+        t0 = time.perf_counter()
+        n = sum(1 for _ in a_map.iter_type(Cell))
+        t_iter = time.perf_counter() - t0
+
+        extra = f" chunks={a_map.chunk_count}" if isinstance(a_map, ChunkedMap) else ""
+        print(
+            f"  {cls.__name__:>10}: {b} build {t_build:6.2f}s  mem {mem / 2**20:8.1f} MiB"
+            f"  get {t_get * 1e9:6.0f} ns  iter_type(Cell) {t_iter * 1000:8.1f} ms ({n} cells){extra}"
+        )
+        del a_map
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Time the field-of-view engines (space.map.fov) against each other.
+
+Loads the station maps, picks a handful of observer positions and runs every
+registered engine from each of them, with and without a light radius.
+
+Usage:
+  python scripts/bench-fov.py [-n observers] [--seed N] [map ...]
+
+Defaults to asset/station1.map and asset/station2.map.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map import import_map_from_path
+from space.map.fov import FOV_ENGINES, is_opaque
+
+STATIONS = ("asset/station1.map", "asset/station2.map")
+
+
+def bench(a_map, positions, engine, maxdist=None):
+    a_map.fov_engine = engine
+    t0 = time.perf_counter()
+    for pos in positions:
+        a_map.fov(pos, maxdist=maxdist)
+    return (time.perf_counter() - t0) / len(positions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--observers", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("maps", nargs="*", default=STATIONS)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for path in args.maps:
+        a_map = import_map_from_path(path)
+        floors = [c.pos for c in a_map.iter_cells() if not is_opaque(c)]
+        positions = rng.sample(floors, min(args.observers, len(floors)))
+        print(f"{path}: {a_map.bounds} {len(floors)} floor cells, {len(positions)} observers")
+        for maxdist in (None, 12):
+            times = {name: bench(a_map, positions, name, maxdist=maxdist) for name in sorted(FOV_ENGINES)}
+            slowest = max(times.values())
+            for name, t in times.items():
+                print(f"  maxdist={str(maxdist):>4} {name:>10}: {t * 1000:8.2f} ms/fov  ×{slowest / t:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Time the map generators (space.map.generate) and describe what they make.
+
+Each generator is run at each --sizes square (seeded, so every run makes the
+same map as the last one did) and reported with its wall time, its peak
+memory and some numbers about the map (space.map.generate.metrics): its
+bounds, sparseness, how many separate walkable components, dead ends and
+doors it has. Peak memory (tracemalloc) takes a second run, since tracing
+makes it many times slower, and is left out for runs over --max-seconds.
+With --json the results are also written out (- for stdout) along with the
+commit and Python they came from, to compare against later.
+
+Generating grows much faster than the map does for some generators (rdc
+takes about a minute at 200), so once a run takes longer than --max-seconds
+the bigger sizes of that generator are skipped.
+
+Usage:
+  python scripts/bench-generate.py [--generators rdc,boxedin,...] [--sizes 50,100,200,400]
+                                   [--seeds N] [--seed N] [--max-seconds S] [--no-memory] [--json PATH]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map.generate import rdc, boxed_in, lumpy_room, generate_rooms, generate_station
+from space.map.generate.metrics import map_metrics
+
+# name → (generator, its parameters for a size x size map)
+GENERATORS = {
+    "rdropper": (generate_rooms, lambda size: dict(x=size, y=size)),
+    "boxedin": (boxed_in, lambda size: dict(x=size, y=size)),
+    "lumpy": (lumpy_room, lambda size: dict(x=size, y=size, rooms=size // 5)),
+    "rdc": (rdc.generate, lambda size: dict(x=size, y=size)),
+    "toroid": (generate_station, lambda size: dict(outer_radius=max(10, (size - 16) // 2))),
+}
+
+
+def run(fn, params, seed):
+    if fn is not generate_station:  # the station is the same every time
+        params = dict(params, seed=seed)
+    t0 = time.perf_counter()
+    a_map = fn(**params)
+    return a_map, time.perf_counter() - t0
+
+
+def peak_memory(fn, params, seed):
+    tracemalloc.start()
+    run(fn, params, seed)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _names(text):
+    names = [n.strip() for n in text.split(",") if n.strip()]
+    for n in names:
+        if n not in GENERATORS:
+            raise argparse.ArgumentTypeError(f"no generator {n!r} (there's {', '.join(GENERATORS)})")
+    return names
+
+
+def _sizes(text):
+    return [int(s) for s in text.split(",") if s.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generators", type=_names, default=list(GENERATORS))
+    parser.add_argument("--sizes", type=_sizes, default=[50, 100, 200, 400])
+    parser.add_argument("--seeds", type=int, default=1, help="maps per generator and size")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-seconds", type=float, default=30.0)
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc runs")
+    parser.add_argument("--json", default=None, help="write the results here as JSON (- for stdout)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    out = sys.stderr if args.json == "-" else sys.stdout
+    results = list()
+    print(
+        f"{'generator':10} {'size':>5} {'seed':>5} {'time':>9} {'peak':>9} {'bounds':>9}"
+        f" {'sparse':>7} {'comps':>5} {'dead':>5} {'doors':>5}",
+        file=out,
+    )
+    for name in args.generators:
+        fn, params_for = GENERATORS[name]
+        too_slow = None
+        for size in sorted(args.sizes):
+            if too_slow is not None:
+                print(f"{name:10} {size:5d} skipped (took {too_slow:.1f}s at a smaller size)", file=out)
+                results.append(dict(generator=name, size=size, skipped=True))
+                continue
+            params = params_for(size)
+            for seed in range(args.seed, args.seed + args.seeds):
+                a_map, seconds = run(fn, params, seed)
+                metrics = map_metrics(a_map)
+                del a_map
+                peak = peak_memory(fn, params, seed) if args.memory and seconds <= args.max_seconds else None
+                results.append(
+                    dict(generator=name, size=size, seed=seed, params=params, seconds=seconds, peak_bytes=peak, **metrics)
+                )
+                mem = "" if peak is None else f"{peak / 2**20:6.1f}MiB"
+                bounds = f"{metrics['width']}x{metrics['height']}"
+                print(
+                    f"{name:10} {size:5d} {seed:5d} {seconds:8.2f}s {mem:>9} {bounds:>9} {metrics['sparseness']:7.3f}"
+                    f" {metrics['components']:5d} {metrics['dead_ends']:5d} {metrics['doors']:5d}",
+                    file=out,
+                )
+                if seconds > args.max_seconds:
+                    too_slow = seconds
+
+    if args.json is not None:
+        report = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+            print(f"wrote {len(results)} results to {args.json}", file=out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Time the numpy grid (space.map.grid) against the per-cell object path.
+
+Generates a map (rooms dropped by space.map.generate.generate_rooms) and runs
+a few whole-map queries both ways: listing walls, finding the empty margins
+condense would trim, measuring sparseness and counting opaque tiles.
+
+Usage:
+  python scripts/bench-grid.py [--size N] [--seed N] [-r repeats]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map import Cell, Wall
+from space.map.fov import is_opaque
+from space.map.generate import generate_rooms
+from space.map.grid import MapGrid
+
+
+def timeit(fn, repeats):
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        r = fn()
+    return (time.perf_counter() - t0) / repeats, r
+
+
+def object_sparseness(a_map):
+    cells = [c for _, c in a_map]
+    return sum(1 for c in cells if not isinstance(c, Cell)) / len(cells)
+
+
+def object_e_bounds(a_map):
+    """e_bounds() the way Map used to find them, cell by cell"""
+    rows = a_map.cells
+    cols = [[row[i] for row in rows] for i in range(len(rows[0]))]
+
+    def first_empty_before(lines):
+        r = None
+        for k, line in lines:
+            if any(c is not None for c in line):
+                return r
+            r = k
+
+    nj = first_empty_before(enumerate(rows))
+    sj = first_empty_before(reversed(list(enumerate(rows))))
+    ei = first_empty_before(reversed(list(enumerate(cols))))
+    wi = first_empty_before(enumerate(cols))
+    return [nj, sj, ei, wi]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    t0 = time.perf_counter()
+    a_map = generate_rooms(x=args.size, y=args.size)
+    print(f"generate_rooms({args.size}×{args.size}): {a_map.bounds} in {time.perf_counter() - t0:.1f}s")
+
+    t, _ = timeit(lambda: MapGrid(a_map.cells), args.repeats)
+    print(f"  {'build grid':>12}: {t * 1000:9.2f} ms")
+    grid = a_map.grid
+
+    queries = (
+        ("walls", lambda: [p for p, _ in a_map.iter_type(Wall)], lambda: grid.positions(Wall)),
+        ("e_bounds", lambda: object_e_bounds(a_map), grid.e_bounds),
+        ("sparseness", lambda: object_sparseness(a_map), lambda: a_map.sparseness),
+        ("opaque", lambda: sum(1 for _, c in a_map if is_opaque(c)), lambda: int(grid.opaque.sum())),
+    )
+    for name, obj_path, array_path in queries:
+        to, ro = timeit(obj_path, args.repeats)
+        ta, ra = timeit(array_path, args.repeats)
+        same = "ok" if ro == ra else "MISMATCH"
+        print(f"  {name:>12}: objects {to * 1000:9.2f} ms  array {ta * 1000:9.2f} ms  ×{to / ta:7.1f}  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Compare load times of the text ("space.map 1") and binary (.smap) map formats.
+
+A large map is made by stamping a seeded --tile sized rdc map over a --size
+square (see bench-memory.py for why), then exported as text, raw binary and
+RLE binary. Each file is loaded --repeat times with import_map_from_path and
+the best time is reported, along with the time to load it and then touch
+every cell (the loaders leave making the map objects until they're needed).
+Then the same goes for loading just a --window sized square from the middle
+of each, and the peak memory (tracemalloc) of both kinds of load is shown.
+
+Usage:
+  python scripts/bench-io.py [--size N] [--tile N] [--window N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map import Bounds, Map, Cell, import_map_from_path, map_to_text, map_to_binary
+from space.map.generate import rdc
+
+
+def stamped_map(tile, size):
+    rows, cols = len(tile.cells), max(len(row) for row in tile.cells)
+    a_map = Map(size, size)
+    with a_map.batch():
+        for y in range(0, size - rows + 1, rows):
+            for x in range(0, size - cols + 1, cols):
+                a_map.insert_map(x, y, tile)
+    return a_map
+
+
+def best_of(repeat, fn):
+    times = list()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=400)
+    parser.add_argument("--tile", type=int, default=60)
+    parser.add_argument("--window", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    random.seed(args.seed)
+    a_map = stamped_map(rdc.generate(x=args.tile, y=args.tile), args.size)
+    cells = a_map.grid.count(Cell)
+    print(f"{args.size}x{args.size} map from a {args.tile}x{args.tile} rdc tile: {cells} cells")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {
+            "text": (Path(tmp) / "bench.map", map_to_text(a_map).encode("utf-8")),
+            "binary raw": (Path(tmp) / "raw.smap", map_to_binary(a_map, compress=False)),
+            "binary rle": (Path(tmp) / "rle.smap", map_to_binary(a_map, compress=True)),
+        }
+        for path, data in files.values():
+            path.write_bytes(data)
+
+        lo = (args.size - args.window) // 2
+        window = Bounds(lo, lo, lo + args.window - 1, lo + args.window - 1)
+        print(f"{'format':12} {'bytes':>10} {'load':>10} {'load+touch':>12} {'peak':>9}   {'window':>8} {'peak':>9}")
+        for name, (path, data) in files.items():
+            t_load = best_of(args.repeat, lambda path=path: import_map_from_path(path))
+            t_all = best_of(args.repeat, lambda path=path: sum(1 for _ in import_map_from_path(path).iter_type(Cell)))
+            m_load = peak_memory(lambda path=path: import_map_from_path(path))
+            t_win = best_of(args.repeat, lambda path=path: import_map_from_path(path, bounds=window))
+            m_win = peak_memory(lambda path=path: import_map_from_path(path, bounds=window))
+            print(
+                f"{name:12} {len(data):10d} {t_load * 1e3:8.1f}ms {t_all * 1e3:10.1f}ms {m_load / 2**20:6.1f}MiB"
+                f"   {t_win * 1e3:6.1f}ms {m_win / 2**20:6.2f}MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Measure how much memory generated maps take per cell (tracemalloc).
+
+Generating a 500x500 rdc map outright takes many minutes, so each map is a
+--tile sized rdc map (seeded) stamped over and over into a --size square
+with Map.insert_map, which clones every map object just like a generator
+would have made them. What's reported is what the finished map keeps alive
+(after the tile is gone and a gc), divided by how many map objects are on it
+and by how many positions it has.
+
+Usage:
+  python scripts/bench-memory.py [--size N] [--tile N] [--maps N] [--seed N]
+"""
+
+import argparse
+import gc
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map import Map, Wall, Cell
+from space.map.generate import rdc
+
+
+def stamped_map(tile, size):
+    rows, cols = len(tile.cells), max(len(row) for row in tile.cells)
+    a_map = Map(size, size)
+    with a_map.batch():
+        for y in range(0, size - rows + 1, rows):
+            for x in range(0, size - cols + 1, cols):
+                a_map.insert_map(x, y, tile)
+    return a_map
+
+
+def measure(tile, size):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    a_map = stamped_map(tile, size)
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    objs = sum(1 for row in a_map.cells for c in row if c is not None)
+    walls = sum(1 for row in a_map.cells for c in row if isinstance(c, Wall))
+    cells = sum(1 for row in a_map.cells for c in row if isinstance(c, Cell))
+    positions = sum(len(row) for row in a_map.cells)
+    return used, objs, walls, cells, positions, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--tile", type=int, default=100)
+    parser.add_argument("--maps", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    for i in range(args.maps):
+        random.seed(args.seed + i)
+        tile = rdc.generate(x=args.tile, y=args.tile)
+        used, objs, walls, cells, positions, elapsed = measure(tile, args.size)
+        print(
+            f"map {i}: {args.size}x{args.size} from a {tile.bounds} tile ({elapsed:.1f}s): "
+            f"{objs} map objects ({walls} walls, {cells} cells) in {positions} positions"
+        )
+        print(f"  {used / 2**20:.1f} MiB: {used / objs:.0f} bytes per map object, {used / positions:.0f} bytes per position")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Time pathfinding (space.map.path) on generated rdc maps.
+
+For each map: 1000 (by default) A* queries between random floor positions,
+the same trips planned room by room on the region graph (Map.regions), then a
+chase: a crowd of mobs each taking one step toward the same target per
+turn, either by running A* for every mob or by rolling downhill on the
+target's shared distance field (Map.paths.field). Doors are opened first,
+since closed ones aren't walkable.
+
+Usage:
+  python scripts/bench-path.py [--size N] [--maps N] [--queries N] [--mobs N] [--turns N]
+                               [--seed N] [--closed-doors]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.map import BlockedCell
+from space.map.fov import is_opaque
+from space.map.generate import rdc
+from space.map.path import find_path
+
+
+def chase_astar(a_map, mobs, target, turns):
+    mobs = list(mobs)
+    for _ in range(turns):
+        for i, p in enumerate(mobs):
+            path = find_path(a_map, p, target)
+            if path:
+                mobs[i] = path[0]
+    return mobs
+
+
+def chase_field(a_map, mobs, target, turns):
+    mobs = list(mobs)
+    for _ in range(turns):
+        field = a_map.paths.field(target)
+        for i, p in enumerate(mobs):
+            if (q := field.step(p)) is not None:
+                mobs[i] = q
+    return mobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=60)
+    parser.add_argument("--maps", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--mobs", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--closed-doors", action="store_true", help="leave the doors closed (most pairs won't connect)")
+    args = parser.parse_args()
+
+    for n in range(args.maps):
+        random.seed(args.seed + n)
+        rng = random.Random(args.seed + n)
+        a_map = rdc.generate(x=args.size, y=args.size)
+        if not args.closed_doors:
+            for c in a_map.iter_cells(of_type=BlockedCell):
+                if c.has_door:
+                    c.do_open()
+        floors = [c.pos for c in a_map.iter_cells() if not is_opaque(c)]
+        print(f"rdc map #{n} {a_map.bounds}, {len(floors)} floors")
+
+        pairs = [(rng.choice(floors), rng.choice(floors)) for _ in range(args.queries)]
+        t0 = time.perf_counter()
+        found = sum(1 for a, b in pairs if find_path(a_map, a, b) is not None)
+        t = time.perf_counter() - t0
+        print(
+            f"  {'A*':>12}: {args.queries} queries in {t * 1000:8.1f} ms ({t / args.queries * 1e6:7.1f} µs each), {found} found"
+        )
+        regions = a_map.regions
+        t0 = time.perf_counter()
+        routed = sum(1 for a, b in pairs if regions.route(a, b) is not None)
+        t = time.perf_counter() - t0
+        print(
+            f"  {'route':>12}: {args.queries} queries in {t * 1000:8.1f} ms ({t / args.queries * 1e6:7.1f} µs each), {routed} found"
+        )
+
+        target = rng.choice(floors)
+        mobs = rng.sample(floors, min(args.mobs, len(floors)))
+        t0 = time.perf_counter()
+        by_astar = chase_astar(a_map, mobs, target, args.turns)
+        ta = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        by_field = chase_field(a_map, mobs, target, args.turns)
+        tf = time.perf_counter() - t0
+        same = sum(1 for a, b in zip(by_astar, by_field) if a == b)
+        print(
+            f"  {'chase':>12}: {len(mobs)} mobs × {args.turns} turns  A* {ta * 1000:8.1f} ms"
+            f"  field {tf * 1000:8.1f} ms  ×{ta / tf:6.1f}  ({same} ended on the same tile)"
+        )
+
+
+if __name__ == "__main__":
+    main()
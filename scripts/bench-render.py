@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+Compare full-frame map output with the diffing FrameRenderer (space.map.render).
+
+Walks a Human across a station map (100 steps by default, heading for the
+floor cell furthest away), and after every step renders what a `look` would
+show both ways: the full colorized drawing and the cursor-addressed update
+from the previous frame. Reports bytes emitted and time spent.
+
+Usage:
+  python scripts/bench-render.py [-n steps] [--seed N] [--size COLSxROWS] [map]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from space.living import Human
+from space.map import Cell, import_map_from_path
+from space.map.fov import is_opaque
+from space.map.render import FrameRenderer
+from space.msg import MapMessage
+from space.shell.list import Shell as ListShell
+
+
+class SizedShell(ListShell):
+    size = (80, 25)
+
+    @property
+    def terminal_size(self):
+        return self.size
+
+
+def walk(a_map, start, steps, rng):
+    """positions of a walk from `start` toward the furthest reachable floor, then wandering"""
+    prev = {start: None}
+    todo = deque([start])
+    while todo:
+        p = todo.popleft()
+        for _, n in a_map.get(*p).iter_neighbors(of_type=Cell):
+            if n.pos not in prev and not is_opaque(n):
+                prev[n.pos] = p
+                todo.append(n.pos)
+    path = [p]
+    while prev[path[-1]] is not None:
+        path.append(prev[path[-1]])
+    path = path[::-1][1 : steps + 1]
+    while len(path) < steps:
+        here = a_map.get(*(path[-1] if path else start))
+        path.append(rng.choice([n.pos for _, n in here.iter_neighbors(of_type=Cell) if not is_opaque(n)]))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--steps", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--size", default="120x40", help="terminal size the map is clipped to")
+    parser.add_argument("map", nargs="?", default="asset/station1.map")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    a_map = import_map_from_path(args.map)
+    me = Human("Walker")
+    shell = SizedShell(owner=me)
+    shell.size = tuple(int(x) for x in args.size.split("x"))
+    start = rng.choice([c.pos for c in a_map.iter_cells() if not is_opaque(c)])
+    a_map[start] = me
+    path = walk(a_map, start, args.steps, rng)
+
+    renderer = FrameRenderer()
+    full_bytes = diff_bytes = 0
+    full_time = diff_time = 0.0
+    for pos in path:
+        a_map[pos] = me
+        msg = MapMessage(a_map.visicalc_submap(me), tb=me)
+        t0 = time.perf_counter()
+        full = msg.map_drawing_text(color=True)
+        t1 = time.perf_counter()
+        diff = renderer.render(msg.map_frame())
+        t2 = time.perf_counter()
+        full_time += t1 - t0
+        diff_time += t2 - t1
+        full_bytes += len(full.encode())
+        diff_bytes += len(diff.encode())
+
+    n = len(path)
+    print(f"{args.map}: {n} steps from {start}, terminal {args.size}")
+    print(f"  full frames: {full_bytes:9d} bytes ({full_bytes / n:8.0f}/step)  {full_time / n * 1000:7.2f} ms/step")
+    print(
+        f"  diff frames: {diff_bytes:9d} bytes ({diff_bytes / n:8.0f}/step)  {diff_time / n * 1000:7.2f} ms/step"
+        f"  ({renderer.full_frames} full redraws, {full_bytes / max(diff_bytes, 1):.1f}× fewer bytes)"
+    )
+
+
+if __name__ == "__main__":
+    main()